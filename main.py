@@ -5,103 +5,283 @@ import numpy as np
 from streamlit_lottie import st_lottie
 import requests
 import os
+import warnings
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from io import BytesIO
+from html import escape
 from datetime import datetime
 
 # ====================== Utility Functions ======================
 
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    # Shared so retried fetches reuse the pooled connection.
+    return requests.Session()
+
+
+# Persisted to disk so the animation survives app restarts. Streamlit
+# ignores TTLs on persisted caches, so none is set. Failures raise, and
+# raised calls are never cached, so an outage is retried next run.
+@st.cache_data(persist="disk", show_spinner=False)
+def fetch_lottie_json(url):
+    r = get_http_session().get(url, timeout=3)
+    r.raise_for_status()
+    return r.json()
+
+
 def load_lottieurl(url):
-    r = requests.get(url)
-    if r.status_code != 200:
+    try:
+        return fetch_lottie_json(url)
+    except (requests.RequestException, ValueError):
         return None
-    return r.json()
 
 # ====================== Paths ======================
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 MODEL_PATH = os.path.join(BASE_DIR, "models", "svc.pkl")
 DATASET_PATH = os.path.join(BASE_DIR, "Datasets")
 
+# ====================== Static Markup ======================
+
+# Streamlit drops any element a rerun does not emit again, so this markup
+# is still written on every rerun; it is only built once, here.
+
+SIDEBAR_HEADER_HTML = """
+<div style='text-align:center;'>
+    <img src='https://cdn-icons-png.flaticon.com/512/2966/2966484.png' width='80'>
+    <h3>Clinica AI</h3>
+    <p style='color:gray;'>Your personal health prediction companion.</p>
+</div>
+<hr>
+"""
+
+# All app-wide styles, sent in a single markdown call per run
+APP_CSS = """
+<style>
+div.stButton > button, div.stFormSubmitButton > button {
+    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    font-weight: bold;
+    border: none;
+    border-radius: 8px;
+    padding: 12px 24px;
+    font-size: 16px;
+    transition: all 0.3s ease;
+}
+div.stButton > button:hover, div.stFormSubmitButton > button:hover {
+    background: linear-gradient(90deg, #764ba2 0%, #667eea 100%);
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
+}
+.main-title { font-size: 40px; text-align: center; color: #2C3E50; font-weight: 700; }
+.subtitle { text-align: center; color: #7F8C8D; font-size: 18px; }
+[data-testid="stAppViewContainer"] {
+    background: linear-gradient(120deg, #fdfbfb 0%, #ebedee 100%);
+}
+div[data-testid="stHeader"] {
+    background: rgba(0,0,0,0);
+}
+</style>
+"""
+
+# Card heading for each section of the on-screen Full Report
+REPORT_SECTION_HTML = """
+<div style='background: #ffffff; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 15px; margin-top: {margin_top}px;'>
+    <h3 style='color: #667eea; border-bottom: 2px solid #667eea; padding-bottom: 10px;'>{icon} {title}</h3>
+</div>
+"""
+
 # ====================== Load Model & Data ======================
 
-svc = pickle.load(open(MODEL_PATH, "rb"))
-training_df = pd.read_csv(os.path.join(DATASET_PATH, "Training.csv"))
-precautions = pd.read_csv(os.path.join(DATASET_PATH, "precautions_df.csv"))
-workout = pd.read_csv(os.path.join(DATASET_PATH, "workout_df.csv"))
-description = pd.read_csv(os.path.join(DATASET_PATH, "description.csv"))
-medications = pd.read_csv(os.path.join(DATASET_PATH, "medications.csv"))
-diets = pd.read_csv(os.path.join(DATASET_PATH, "diets.csv"))
+# Streamlit re-executes this script on every widget interaction, so the
+# model and datasets are cached to load only once per server process.
 
-symptoms_dict = {symptom: i for i, symptom in enumerate(training_df.columns[:-1])}
+@st.cache_resource(show_spinner=False)
+def load_model():
+    # The model was fitted on a DataFrame; the svc.predict fallback gets a
+    # plain array in the same column order, so the feature-name check is
+    # redundant. Installed here so the process-wide filter is added once.
+    warnings.filterwarnings("ignore", message="X does not have valid feature names", category=UserWarning)
+    with open(MODEL_PATH, "rb") as f:
+        return pickle.load(f)
 
-# ====================== Helper Functions ======================
 
-def helper(dis):
-    desc = description[description['Disease'] == dis]['Description']
-    desc = " ".join([w for w in desc])
+def load_csv(name, usecols=None):
+    return pd.read_csv(os.path.join(DATASET_PATH, name), engine="pyarrow", usecols=usecols)
+
+
+@st.cache_resource(show_spinner=False)
+def load_disease_index():
+    """
+    Index the reference tables by disease so lookups are a dict access
+    instead of a boolean scan over every table.
+
+    Each table is grouped in a single pass, and only these dicts are kept;
+    the DataFrames are dropped once the function returns.
+    """
+    precaution_cols = ['Precaution_1', 'Precaution_2', 'Precaution_3', 'Precaution_4']
+    description = load_csv("description.csv", usecols=['Disease', 'Description'])
+    precautions = load_csv("precautions_df.csv", usecols=['Disease', *precaution_cols])
+    medications = load_csv("medications.csv", usecols=['Disease', 'Medication'])
+    diets = load_csv("diets.csv", usecols=['Disease', 'Diet'])
+    workout = load_csv("workout_df.csv", usecols=['disease', 'workout'])
+
+    return {
+        "desc": description.groupby('Disease', sort=False)['Description'].agg(" ".join).to_dict(),
+        # Blank precaution cells become "" (not NaN) so every value is a str
+        # and the on-screen and PDF lists skip them instead of printing "nan".
+        "pre": {dis: g[precaution_cols].fillna("").values.tolist()
+                for dis, g in precautions.groupby('Disease', sort=False)},
+        "med": medications.groupby('Disease', sort=False)['Medication'].agg(list).to_dict(),
+        "die": diets.groupby('Disease', sort=False)['Diet'].agg(list).to_dict(),
+        "wrkout": workout.groupby('disease', sort=False)['workout'].agg(list).to_dict(),
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def load_ovo_decision():
+    """
+    Unpack a multi-class linear SVC into the pieces of libsvm's one-vs-one
+    decision function, so a one-hot input can be scored from its active
+    symptoms alone. Returns None for models this shortcut does not cover.
 
-    pre = precautions[precautions['Disease'] == dis][['Precaution_1', 'Precaution_2', 'Precaution_3', 'Precaution_4']]
-    pre = [col for col in pre.values]
+    For pair p = (i, j) the decision value is the sum, in libsvm's order,
+    of dual coefficient * kernel value over the support vectors of class i
+    then class j, plus the intercept; class i gets the vote when it is > 0.
+    """
+    model = load_model()
+    n_classes = len(model.classes_)
+    # break_ties makes SVC.predict take the decision-function argmax instead
+    # of voting, and sparse-fitted models keep sparse support vectors.
+    if model.kernel != "linear" or n_classes < 3 or model.break_ties or model._sparse:
+        return None
 
-    med = medications[medications['Disease'] == dis]['Medication']
-    med = [m for m in med.values]
+    starts = np.concatenate([[0], np.cumsum(model.n_support_)])
+    first, second = np.triu_indices(n_classes, k=1)
+    pair_svs, pair_coefs = [], []
+    for i, j in zip(first, second):
+        sv_i = np.arange(starts[i], starts[i + 1])
+        sv_j = np.arange(starts[j], starts[j + 1])
+        pair_svs.append(np.concatenate([sv_i, sv_j]))
+        pair_coefs.append(np.concatenate([model.dual_coef_[j - 1, sv_i], model.dual_coef_[i, sv_j]]))
+
+    # Pad every pair to the same length; zero coefficients leave the
+    # running sums unchanged.
+    width = max(len(svs) for svs in pair_svs)
+    sv_index = np.zeros((len(pair_svs), width), dtype=np.intp)
+    coef = np.zeros((len(pair_svs), width), dtype=np.float64)
+    for p, (svs, coefs) in enumerate(zip(pair_svs, pair_coefs)):
+        sv_index[p, :len(svs)] = svs
+        coef[p, :len(coefs)] = coefs
+
+    # Support vectors are training rows, so for this one-hot data they hold
+    # only 0/1 and fit losslessly in uint8 (an eighth of the float64 bytes
+    # gathered per prediction). The coefficients stay float64: rounding them
+    # would move decision values that sit on zero.
+    support_vectors = model.support_vectors_.T
+    if np.isin(support_vectors, (0, 1)).all():
+        support_vectors = support_vectors.astype(np.uint8)
+
+    return {
+        # Symptom-major, so the rows for the active symptoms are contiguous.
+        "support_vectors": np.ascontiguousarray(support_vectors),
+        "sv_index": sv_index,
+        "coef": coef,
+        "intercept": model.intercept_,
+        "first": first,
+        "second": second,
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def load_symptom_index():
+    # The model keeps the symptom columns it was fitted on, so the training
+    # set itself never needs to be read.
+    symptoms = tuple(load_model().feature_names_in_)
+    return {symptom: i for i, symptom in enumerate(symptoms)}, symptoms
+
+
+svc = load_model()
+disease_index = load_disease_index()
+ovo_decision = load_ovo_decision()
+
+symptoms_dict, ALL_SYMPTOMS = load_symptom_index()
 
-    die = diets[diets['Disease'] == dis]['Diet']
-    die = [d for d in die.values]
+# ====================== Helper Functions ======================
 
-    wrkout = workout[workout['disease'] == dis]['workout']
+def helper(dis):
+    desc = disease_index["desc"].get(dis, "")
+    pre = disease_index["pre"].get(dis, [])
+    med = disease_index["med"].get(dis, [])
+    die = disease_index["die"].get(dis, [])
+    wrkout = disease_index["wrkout"].get(dis, [])
 
     return desc, pre, med, die, wrkout
 
 
 def get_predicted_value(patient_symptoms):
-    input_vector = np.zeros(len(symptoms_dict))
-    for item in patient_symptoms:
-        if item in symptoms_dict:
-            input_vector[symptoms_dict[item]] = 1
-    X_input = pd.DataFrame([input_vector], columns=list(symptoms_dict.keys()))
-    pred = svc.predict(X_input)[0]
+    # Selection order and repeats don't affect the prediction, so the
+    # sorted set of symptom indices is the cache key.
+    idxs = sorted({i for s in patient_symptoms if (i := symptoms_dict.get(s)) is not None})
+    return predict_from_indices(tuple(idxs))
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def predict_from_indices(symptom_idxs):
+    idxs = np.array(symptom_idxs, dtype=np.intp)
+
+    if ovo_decision is not None:
+        # With a one-hot input, the linear kernel against each support vector
+        # is the sum of that vector's active-symptom entries. The support
+        # vectors are training rows of 0/1 values, so these sums are exact
+        # and the votes below match svc.predict.
+        kernel = ovo_decision["support_vectors"][idxs].sum(axis=0)
+        terms = ovo_decision["coef"] * kernel[ovo_decision["sv_index"]]
+        # cumsum adds left to right like libsvm; np.sum's pairwise order
+        # could flip decision values that sit exactly on zero.
+        decision = np.cumsum(terms, axis=1)[:, -1] + ovo_decision["intercept"]
+        votes = np.bincount(np.where(decision > 0, ovo_decision["first"], ovo_decision["second"]),
+                            minlength=len(svc.classes_))
+        return svc.classes_[votes.argmax()]
+
+    input_vector = np.zeros((1, len(symptoms_dict)), dtype=np.float64)
+    input_vector[0, idxs] = 1.0
+    pred = svc.predict(input_vector)[0]
     return pred
 
 
-def generate_pdf_report(disease_name, desc, precautions, medications, diets, workouts):
+def render_bullets(items):
+    # One markdown element for the whole list rather than one per item
+    st.markdown("\n".join(f"- {x}" for x in items if x and str(x).strip()))
+
+
+@st.cache_resource(show_spinner=False)
+def load_pdf_styles():
     """
-    Generate a PDF report for the predicted disease.
+    Build the report's paragraph styles once per process.
     """
-    try:
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter,
-                               rightMargin=72, leftMargin=72,
-                               topMargin=72, bottomMargin=18)
-        
-        # Container for the 'Flowable' objects
-        elements = []
-        
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=24,
             spaceAfter=30,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
-        )
-        
-        heading_style = ParagraphStyle(
+        ),
+        "heading": ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=16,
             spaceAfter=12,
             spaceBefore=12,
             fontName='Helvetica-Bold'
-        )
-        
-        disease_style = ParagraphStyle(
+        ),
+        "disease": ParagraphStyle(
             'DiseaseStyle',
             parent=styles['Heading2'],
             fontSize=18,
@@ -109,143 +289,112 @@ def generate_pdf_report(disease_name, desc, precautions, medications, diets, wor
             spaceBefore=10,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
-        )
-        
-        body_style = styles['BodyText']
-        body_style.fontSize = 11
-        body_style.leading = 14
-        
-        # Add title
-        title = Paragraph("Full Disease Report", title_style)
-        elements.append(title)
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Add date
-        date_text = f"<i>Report Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</i>"
-        date_para = Paragraph(date_text, body_style)
-        elements.append(date_para)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        # Add info text
-        info_text = "This section provides a complete disease report based on the latest prediction you made."
-        info_para = Paragraph(info_text, body_style)
-        elements.append(info_para)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        # Add predicted disease
-        disease_heading = Paragraph(f"<b>Predicted Disease: {disease_name}</b>", disease_style)
-        elements.append(disease_heading)
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Add Description
-        desc_heading = Paragraph("<b>Description</b>", heading_style)
-        elements.append(desc_heading)
-        # Clean description text
-        clean_desc = str(desc).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-        desc_para = Paragraph(clean_desc, body_style)
-        elements.append(desc_para)
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Add Precautions
-        prec_heading = Paragraph("<b>Precautions</b>", heading_style)
-        elements.append(prec_heading)
-        prec_items = [ListItem(Paragraph(str(p).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'), body_style)) for p in precautions[0] if p and str(p).strip()]
-        if prec_items:
-            prec_list = ListFlowable(prec_items, bulletType='bullet')
-            elements.append(prec_list)
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Add Medications
-        med_heading = Paragraph("<b>Medications</b>", heading_style)
-        elements.append(med_heading)
-        med_items = [ListItem(Paragraph(str(m).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'), body_style)) for m in medications if m and str(m).strip()]
-        if med_items:
-            med_list = ListFlowable(med_items, bulletType='bullet')
-            elements.append(med_list)
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Add Diet
-        diet_heading = Paragraph("<b>Diet</b>", heading_style)
-        elements.append(diet_heading)
-        diet_items = [ListItem(Paragraph(str(d).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'), body_style)) for d in diets if d and str(d).strip()]
-        if diet_items:
-            diet_list = ListFlowable(diet_items, bulletType='bullet')
-            elements.append(diet_list)
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Add Workout
-        workout_heading = Paragraph("<b>Workout</b>", heading_style)
-        elements.append(workout_heading)
-        workout_items = [ListItem(Paragraph(str(w).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'), body_style)) for w in workouts if w and str(w).strip()]
-        if workout_items:
-            workout_list = ListFlowable(workout_items, bulletType='bullet')
-            elements.append(workout_list)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        # Add footer
-        footer_text = "<i>Disclaimer: This report is generated by an AI system and should not replace professional medical advice.</i>"
-        footer_para = Paragraph(footer_text, body_style)
-        elements.append(Spacer(1, 0.3*inch))
-        elements.append(footer_para)
-        
-        # Build PDF
-        doc.build(elements)
-        buffer.seek(0)
-        return buffer
-    except Exception as e:
-        st.error(f"Error generating PDF: {str(e)}")
-        return None
+        ),
+        # Derived rather than mutating the sample sheet's shared BodyText.
+        "body": ParagraphStyle(
+            'CustomBody',
+            parent=styles['BodyText'],
+            fontSize=11,
+            leading=14
+        ),
+        # Body text with a hanging bullet, laid out like ListFlowable's
+        # default bullet list but as a single Paragraph per item.
+        "bullet": ParagraphStyle(
+            'CustomBullet',
+            parent=styles['BodyText'],
+            fontSize=11,
+            leading=14,
+            leftIndent=18,
+            bulletIndent=0,
+            bulletFontName='Helvetica',
+            bulletFontSize=12
+        ),
+    }
+
+
+def generate_pdf_report(disease_name, desc, precautions, medications, diets, workouts, generated_at):
+    """
+    Generate a PDF report for the predicted disease and return its bytes.
+
+    Errors propagate so a failed build is never cached by
+    get_disease_report_pdf; the Full Report page renders them.
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                           rightMargin=72, leftMargin=72,
+                           topMargin=72, bottomMargin=18)
+    
+    styles = load_pdf_styles()
+    heading_style = styles["heading"]
+    body_style = styles["body"]
+    bullet_style = styles["bullet"]
+
+    def text_section(title, text, space_after=0.2):
+        return [
+            Paragraph(f"<b>{title}</b>", heading_style),
+            Paragraph(escape(str(text), quote=False), body_style),
+            Spacer(1, space_after*inch),
+        ]
+
+    def bullet_section(title, items, space_after=0.2):
+        section = [Paragraph(f"<b>{title}</b>", heading_style)]
+        section.extend(Paragraph(escape(str(item), quote=False), bullet_style, bulletText="\u2022")
+                       for item in items if item and str(item).strip())
+        section.append(Spacer(1, space_after*inch))
+        return section
+
+    # All flowables in document order, handed to a single doc.build()
+    elements = [
+        Paragraph("Full Disease Report", styles["title"]),
+        Spacer(1, 0.2*inch),
+        Paragraph(f"<i>Report Generated: {generated_at}</i>", body_style),
+        Spacer(1, 0.3*inch),
+        Paragraph("This section provides a complete disease report based on the latest prediction you made.", body_style),
+        Spacer(1, 0.3*inch),
+        Paragraph(f"<b>Predicted Disease: {disease_name}</b>", styles["disease"]),
+        Spacer(1, 0.2*inch),
+        *text_section("Description", desc),
+        *bullet_section("Precautions", precautions[0]),
+        *bullet_section("Medications", medications),
+        *bullet_section("Diet", diets),
+        *bullet_section("Workout", workouts, space_after=0.3),
+        Spacer(1, 0.3*inch),
+        Paragraph("<i>Disclaimer: This report is generated by an AI system and should not replace professional medical advice.</i>", body_style),
+    ]
+    
+    # Build PDF
+    doc.build(elements)
+    return buffer.getvalue()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_disease_report_pdf(disease_name, generated_at):
+    """
+    Return the PDF report for a disease, reusing an earlier render.
+
+    The report's contents follow from the disease name, so the cache is
+    keyed on that and ``generated_at`` (the timestamp printed on the
+    report, to the minute) rather than on every section's items. An entry
+    can't be hit once its minute has passed, so it expires after 60s.
+    """
+    return generate_pdf_report(disease_name, *helper(disease_name), generated_at)
 
 # ====================== Streamlit UI Setup ======================
 
 st.set_page_config(page_title="AI Disease Prediction", page_icon="🏥", layout="wide")
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # Sidebar
 with st.sidebar:
-    st.markdown("""
-        <div style='text-align:center;'>
-            <img src='https://cdn-icons-png.flaticon.com/512/2966/2966484.png' width='80'>
-            <h3>Clinica AI</h3>
-            <p style='color:gray;'>Your personal health prediction companion.</p>
-        </div>
-        <hr>
-    """, unsafe_allow_html=True)
+    st.markdown(SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
 
     page = st.radio("Navigate to:", ["Predict Disease", "About Model", "Contact Support"])
     st.markdown("---")
     
-    # Styled PDF Full Report button
-    st.markdown("""
-        <style>
-        div.stButton > button {
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            font-weight: bold;
-            border: none;
-            border-radius: 8px;
-            padding: 12px 24px;
-            font-size: 16px;
-            transition: all 0.3s ease;
-        }
-        div.stButton > button:hover {
-            background: linear-gradient(90deg, #764ba2 0%, #667eea 100%);
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     full_report_button = st.button("📝 PDF Full Report", use_container_width=True)
     st.markdown("<p style='text-align:center;'>Developed by <b>Gaurav, Suraj and Rahul</b></p>", unsafe_allow_html=True)
 
 # Header
-st.markdown("""
-    <style>
-    .main-title { font-size: 40px; text-align: center; color: #2C3E50; font-weight: 700; }
-    .subtitle { text-align: center; color: #7F8C8D; font-size: 18px; }
-    </style>
-""", unsafe_allow_html=True)
-
 st.markdown("<div class='main-title'>🏥 Clinica AI</div>", unsafe_allow_html=True)
 st.markdown("<div class='subtitle'>Enter your symptoms and get AI-powered diagnosis & insights.</div>", unsafe_allow_html=True)
 
@@ -256,12 +405,18 @@ if lottie_ai:
 
 # ====================== Pages ======================
 
-# Predict Disease Page
-if page == "Predict Disease":
-    all_symptoms = list(symptoms_dict.keys())
-    selected_symptoms = st.multiselect("Select symptoms:", all_symptoms)
+# Both pages run as fragments so widget interactions inside them rerun
+# only the page itself rather than the whole script.
 
-    if st.button("🔍 Predict"):
+@st.fragment
+def predict_page():
+    # The form holds back reruns until Predict is pressed, instead of
+    # rerunning on every symptom added or removed.
+    with st.form("predict_form"):
+        selected_symptoms = st.multiselect("Select symptoms:", ALL_SYMPTOMS)
+        submitted = st.form_submit_button("🔍 Predict")
+
+    if submitted:
         if not selected_symptoms:
             st.warning("⚠️ Please select at least one symptom.")
         else:
@@ -281,20 +436,17 @@ if page == "Predict Disease":
             with tabs[1]:
                 st.info(desc)
             with tabs[2]:
-                for p in pre[0]:
-                    st.write(f"- {p}")
+                render_bullets(pre[0])
             with tabs[3]:
-                for m in med:
-                    st.write(f"- {m}")
+                render_bullets(med)
             with tabs[4]:
-                for w in wrkout:
-                    st.write(f"- {w}")
+                render_bullets(wrkout)
             with tabs[5]:
-                for d in die:
-                    st.write(f"- {d}")
+                render_bullets(die)
 
-# Full Report Page
-if full_report_button:
+
+@st.fragment
+def full_report_page():
     st.markdown("""
         <div style='text-align: center; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 15px; margin-bottom: 20px;'>
             <h1 style='color: white; margin: 0;'>📋 PDF Full Disease Report</h1>
@@ -326,49 +478,18 @@ if full_report_button:
             </div>
         """, unsafe_allow_html=True)
         
-        # Description Section
-        st.markdown("""
-            <div style='background: #ffffff; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 15px;'>
-                <h3 style='color: #667eea; border-bottom: 2px solid #667eea; padding-bottom: 10px;'>📝 Description</h3>
-            </div>
-        """, unsafe_allow_html=True)
+        # Description, then one bulleted card per recommendation list
+        st.markdown(REPORT_SECTION_HTML.format(margin_top=0, icon="📝", title="Description"), unsafe_allow_html=True)
         st.write(desc)
-        
-        # Precautions Section
-        st.markdown("""
-            <div style='background: #ffffff; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 15px; margin-top: 15px;'>
-                <h3 style='color: #667eea; border-bottom: 2px solid #667eea; padding-bottom: 10px;'>⚠️ Precautions</h3>
-            </div>
-        """, unsafe_allow_html=True)
-        for p in pre[0]:
-            st.write(f"• {p}")
-        
-        # Medications Section
-        st.markdown("""
-            <div style='background: #ffffff; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 15px; margin-top: 15px;'>
-                <h3 style='color: #667eea; border-bottom: 2px solid #667eea; padding-bottom: 10px;'>💊 Medications</h3>
-            </div>
-        """, unsafe_allow_html=True)
-        for m in med:
-            st.write(f"• {m}")
-        
-        # Diet Section
-        st.markdown("""
-            <div style='background: #ffffff; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 15px; margin-top: 15px;'>
-                <h3 style='color: #667eea; border-bottom: 2px solid #667eea; padding-bottom: 10px;'>🥗 Diet Recommendations</h3>
-            </div>
-        """, unsafe_allow_html=True)
-        for d in die:
-            st.write(f"• {d}")
-        
-        # Workout Section
-        st.markdown("""
-            <div style='background: #ffffff; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 15px; margin-top: 15px;'>
-                <h3 style='color: #667eea; border-bottom: 2px solid #667eea; padding-bottom: 10px;'>🏋️‍♂️ Workout Plan</h3>
-            </div>
-        """, unsafe_allow_html=True)
-        for w in wrkout:
-            st.write(f"• {w}")
+
+        for icon, title, items in (
+            ("⚠️", "Precautions", pre[0]),
+            ("💊", "Medications", med),
+            ("🥗", "Diet Recommendations", die),
+            ("🏋️‍♂️", "Workout Plan", wrkout),
+        ):
+            st.markdown(REPORT_SECTION_HTML.format(margin_top=15, icon=icon, title=title), unsafe_allow_html=True)
+            render_bullets(items)
         
         # PDF Generation Section with enhanced styling
         st.markdown("---")
@@ -381,9 +502,10 @@ if full_report_button:
         
         try:
             with st.spinner('Generating your PDF report...'):
-                pdf_buffer = generate_pdf_report(dis, desc, pre, med, die, wrkout)
+                generated_at = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+                pdf_bytes = get_disease_report_pdf(dis, generated_at)
             
-            if pdf_buffer:
+            if pdf_bytes:
                 st.success("✅ PDF Generated Successfully!")
                 
                 # Enhanced download button with custom styling
@@ -391,7 +513,7 @@ if full_report_button:
                 with col2:
                     st.download_button(
                         label="📥 Download PDF Report",
-                        data=pdf_buffer,
+                        data=pdf_bytes,
                         file_name=f"{dis.replace(' ', '_')}_Medical_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
                         mime="application/pdf",
                         use_container_width=True,
@@ -412,6 +534,15 @@ if full_report_button:
             import traceback
             st.code(traceback.format_exc())
 
+
+# Full Report Page (replaces the selected page for the run it is requested on)
+if full_report_button:
+    full_report_page()
+
+# Predict Disease Page
+elif page == "Predict Disease":
+    predict_page()
+
 # About Model Page
 elif page == "About Model":
     st.subheader("📘 Model Overview")
@@ -431,15 +562,3 @@ elif page == "Contact Support":
     st.write("- 📧 Email: gauravdehlon@gmail.com")
     st.write("- 💬 WhatsApp: +91 9877473481, +91 6239346562")
     st.write("- 🌐 Website: [HealthCare AI Portal](https://healthcareai.com)")
-
-# ====================== Custom CSS ======================
-st.markdown("""
-<style>
-[data-testid="stAppViewContainer"] {
-    background: linear-gradient(120deg, #fdfbfb 0%, #ebedee 100%);
-}
-div[data-testid="stHeader"] {
-    background: rgba(0,0,0,0);
-}
-</style>
-""", unsafe_allow_html=True)